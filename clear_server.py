@@ -6,103 +6,173 @@ Run this in the background: python clear_server.py
 Links in emails will point to: http://localhost:5050/hide?player=...&id=...
 """
 
+import fcntl
 import json
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from flask import Flask, request
+from flask import Flask, Response, request
 from urllib.parse import unquote
 
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+    # Fall back to the stdlib with compact separators
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
 app = Flask(__name__)
 SEEN_LISTINGS_FILE = Path(__file__).parent / "seen_listings.json"
+# Also taken by ebay_card_monitor.py, so hides here and a scan's save don't clobber each other
+SEEN_LOCK_FILE = SEEN_LISTINGS_FILE.with_suffix(".lock")
+# Hides are appended here (JSON ["player", "item_id"] lines); ebay_card_monitor.py reads the same log
+SEEN_LOG_FILE = SEEN_LISTINGS_FILE.with_suffix(".log")
+
+# Parsed seen_listings, reused until the snapshot or log changes on disk. The cached
+# dict (player -> frozenset) is shared by request threads, so it is never modified;
+# changes build a new dict and swap it in once they're on disk.
+_CACHE = {"key": None, "data": None}
+_cache_lock = threading.Lock()
+
+def _disk_key():
+    """Identify the on-disk state: snapshot mtime plus log size."""
+    try:
+        snapshot = SEEN_LISTINGS_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        snapshot = None
+    try:
+        log_size = SEEN_LOG_FILE.stat().st_size
+    except FileNotFoundError:
+        log_size = None
+    return snapshot, log_size
+
+def _read_seen_log(data: bytes):
+    """Yield (player, item_id) for each line of the seen log.
+
+    Lines are JSON ["player", "item_id"] arrays, so any player name round-trips; older
+    logs used "player\titem_id" lines, which are still read.
+    """
+    for line in data.split(b"\n"):
+        if line.startswith(b"["):
+            try:
+                player, item_id = _json_loads(line)
+                yield player, item_id
+                continue
+            except ValueError:
+                pass  # An older tab-separated line, or one cut short by a crash mid-append
+        player, sep, item_id = line.decode(errors="replace").partition("\t")
+        if sep:
+            yield player, item_id
+
+def _seen_log_prefix(f) -> bytes:
+    """A newline if the log (opened "a+b") ends mid-line, e.g. after a crash mid-append."""
+    if not f.tell():
+        return b""
+    f.seek(-1, os.SEEK_END)
+    return b"" if f.read(1) == b"\n" else b"\n"
 
 def load_seen():
-    """Load seen listings as dict: player_name -> list of item_ids."""
-    if SEEN_LISTINGS_FILE.exists():
-        with open(SEEN_LISTINGS_FILE, "r") as f:
-            data = json.load(f)
+    """Load seen listings as dict: player_name -> frozenset of item_ids (read-only)."""
+    key = _disk_key()
+    if key == (None, None):
+        return {}
+    with _cache_lock:
+        if _CACHE["key"] == key:
+            return _CACHE["data"]
+        data = {}
+        if key[0] is not None:
+            data = _json_loads(SEEN_LISTINGS_FILE.read_bytes())
             # Handle old format (list) - migrate to new format
             if isinstance(data, list):
-                return {"_legacy": data}
-            return data
-    return {}
+                data = {"_legacy": set(data)}
+            else:
+                data = {player: set(ids) for player, ids in data.items()}
+        # Replay hides appended since the snapshot was written
+        if key[1]:
+            for player, item_id in _read_seen_log(SEEN_LOG_FILE.read_bytes()):
+                data.setdefault(player, set()).add(item_id)
+        data = {player: frozenset(ids) for player, ids in data.items()}
+        _CACHE["key"] = key
+        _CACHE["data"] = data
+        return data
+
+@contextmanager
+def seen_lock():
+    """Hold the seen_listings lock for a read-modify-write."""
+    with open(SEEN_LOCK_FILE, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
 
 def save_seen(seen):
-    with open(SEEN_LISTINGS_FILE, "w") as f:
-        json.dump(seen, f)
-
-@app.route("/")
-def index():
-    seen = load_seen()
-    total = sum(len(ids) for ids in seen.values())
-    player_list = "<br>".join(f"  {player}: {len(ids)} items" for player, ids in seen.items())
-    return f"""
+    """Write seen as the new snapshot; the cache only switches to it once it's on disk."""
+    with _cache_lock:
+        # Write to a temp file and rename so a crash can't leave a truncated file
+        tmp = SEEN_LISTINGS_FILE.with_suffix(".json.tmp")
+        # Convert sets to sorted lists for JSON serialization
+        data = {player: sorted(ids) for player, ids in seen.items()}
+        tmp.write_bytes(_json_dumps(data))
+        os.replace(tmp, SEEN_LISTINGS_FILE)
+        # Everything in the log is now in the snapshot
+        SEEN_LOG_FILE.unlink(missing_ok=True)
+        # Refresh the cache so the next request doesn't re-read what we just wrote
+        _CACHE["key"] = _disk_key()
+        _CACHE["data"] = {player: frozenset(ids) for player, ids in seen.items()}
+
+def append_seen(seen, player, item_id):
+    """Record one hide by appending to the log instead of rewriting the snapshot."""
+    with _cache_lock:
+        with open(SEEN_LOG_FILE, "a+b") as f:
+            f.write(_seen_log_prefix(f) + _json_dumps([player, item_id]) + b"\n")
+        # A new dict, so threads still reading the old one aren't affected
+        updated = dict(seen)
+        updated[player] = seen.get(player, frozenset()) | {item_id}
+        _CACHE["key"] = _disk_key()
+        _CACHE["data"] = updated
+
+# Response pages, encoded once at import; handlers only fill in the %s slots
+_INDEX_PAGE = """
     <html>
     <head><title>eBay Monitor</title></head>
     <body style="font-family: system-ui; max-width: 600px; margin: 50px auto; padding: 20px;">
         <h1>eBay Card Monitor</h1>
-        <p>Currently tracking <strong>{total}</strong> hidden listings:</p>
-        <p style="font-family: monospace; margin-left: 20px;">{player_list}</p>
+        <p>Currently tracking <strong>%s</strong> hidden listings:</p>
+        <p style="font-family: monospace; margin-left: 20px;">%s</p>
         <p><a href="/clear-all">Clear all hidden listings</a></p>
     </body>
     </html>
-    """
-
-@app.route("/hide")
-def hide_item():
-    player = unquote(request.args.get("player", ""))
-    item_id = request.args.get("id", "")
-
-    if not player or not item_id:
-        return "Missing player or id parameter", 400
+    """.encode()
 
-    seen = load_seen()
-    if player not in seen:
-        seen[player] = []
-
-    if item_id not in seen[player]:
-        seen[player].append(item_id)
-        save_seen(seen)
-        status = "Hidden"
-    else:
-        status = "Already hidden"
-
-    return f"""
+_HIDE_PAGE = """
     <html>
-    <head><title>{status}</title></head>
+    <head><title>%s</title></head>
     <body style="font-family: system-ui; max-width: 600px; margin: 50px auto; padding: 20px;">
-        <h1>✅ {status}</h1>
-        <p>Item <strong>{item_id}</strong> will no longer appear in <strong>{player}</strong> emails.</p>
+        <h1>✅ %s</h1>
+        <p>Item <strong>%s</strong> will no longer appear in <strong>%s</strong> emails.</p>
         <p><a href="/">Back to home</a></p>
     </body>
     </html>
-    """
-
-@app.route("/clear")
-def clear_query():
-    player = unquote(request.args.get("player", "") or request.args.get("query", ""))
-    if not player:
-        return "No player specified", 400
-
-    seen = load_seen()
-    count = len(seen.get(player, []))
-    if player in seen:
-        del seen[player]
-        save_seen(seen)
+    """.encode()
 
-    return f"""
+_CLEAR_PAGE = """
     <html>
     <head><title>Cleared</title></head>
     <body style="font-family: system-ui; max-width: 600px; margin: 50px auto; padding: 20px;">
         <h1>✅ History Cleared</h1>
-        <p>Cleared {count} hidden listings for "<strong>{player}</strong>". All results will appear in the next scan.</p>
+        <p>Cleared %s hidden listings for "<strong>%s</strong>". All results will appear in the next scan.</p>
         <p><a href="/">Back to home</a></p>
     </body>
     </html>
-    """
+    """.encode()
 
-@app.route("/clear-all")
-def clear_all():
-    save_seen({})
-    return f"""
+_CLEAR_ALL_PAGE = """
     <html>
     <head><title>Cleared</title></head>
     <body style="font-family: system-ui; max-width: 600px; margin: 50px auto; padding: 20px;">
@@ -111,7 +181,57 @@ def clear_all():
         <p><a href="/">Back to home</a></p>
     </body>
     </html>
-    """
+    """.encode()
+
+def _html(body: bytes) -> Response:
+    return Response(body, mimetype="text/html")
+
+@app.route("/")
+def index():
+    seen = load_seen()
+    total = sum(len(ids) for ids in seen.values())
+    player_list = "<br>".join(f"  {player}: {len(ids)} items" for player, ids in seen.items())
+    return _html(_INDEX_PAGE % (str(total).encode(), player_list.encode()))
+
+@app.route("/hide")
+def hide_item():
+    player = unquote(request.args.get("player", ""))
+    item_id = request.args.get("id", "")
+
+    if not player or not item_id:
+        return "Missing player or id parameter", 400
+
+    with seen_lock():
+        seen = load_seen()
+        if item_id not in seen.get(player, ()):
+            append_seen(seen, player, item_id)
+            status = b"Hidden"
+        else:
+            status = b"Already hidden"
+
+    return _html(_HIDE_PAGE % (status, status, item_id.encode(), player.encode()))
+
+@app.route("/clear")
+def clear_query():
+    player = unquote(request.args.get("player", "") or request.args.get("query", ""))
+    if not player:
+        return "No player specified", 400
+
+    with seen_lock():
+        seen = load_seen()
+        count = len(seen.get(player, []))
+        if player in seen:
+            save_seen({p: ids for p, ids in seen.items() if p != player})
+
+    return _html(_CLEAR_PAGE % (str(count).encode(), player.encode()))
+
+@app.route("/clear-all")
+def clear_all():
+    with seen_lock():
+        # Nothing to write if there's nothing hidden
+        if load_seen():
+            save_seen({})
+    return _html(_CLEAR_ALL_PAGE)
 
 if __name__ == "__main__":
     print("Starting clear server on http://localhost:5050")
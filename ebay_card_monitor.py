@@ -10,34 +10,76 @@ Setup:
 Run manually or set up as a cron job for hourly checks
 """
 
+import asyncio
+import bisect
 import json
 import time
 import random
 import re
 import os
 import fcntl
+import functools
 import sys
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import quote, urlencode
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
 
 try:
-    from playwright.sync_api import sync_playwright
+    import orjson
+
+    def _json_dumps(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+
+    _json_loads = orjson.loads
+except ImportError:
+    # Fall back to the stdlib with compact separators
+    def _json_dumps(obj, indent: bool = False) -> bytes:
+        if indent:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
+try:
+    # Optional: matches all of a query's terms in one pass over each title
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+try:
+    # Optional: fetch search pages without the browser when eBay serves them plainly
+    import requests
+    from bs4 import BeautifulSoup
+    HTTP_AVAILABLE = True
+except ImportError:
+    HTTP_AVAILABLE = False
+
 # ============== CONFIGURATION ==============
 
 WATCHLIST_FILE = Path("watchlist.json")
 
+# Parsed watchlist, reused until watchlist.json changes on disk
+_WATCHLIST_CACHE = {"mtime": None, "data": {}}
+
 def load_watchlist():
-    if WATCHLIST_FILE.exists():
-        with open(WATCHLIST_FILE, "r") as f:
-            return json.load(f)
-    return {}
+    try:
+        mtime = WATCHLIST_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    if _WATCHLIST_CACHE["mtime"] != mtime:
+        _WATCHLIST_CACHE["data"] = _json_loads(WATCHLIST_FILE.read_bytes())
+        _WATCHLIST_CACHE["mtime"] = mtime
+    return _WATCHLIST_CACHE["data"]
 
 EMAIL_CONFIG = {
     "enabled": True,
@@ -49,17 +91,359 @@ EMAIL_CONFIG = {
 }
 
 SEEN_LISTINGS_FILE = Path("seen_listings.json")
+# Shared with clear_server.py around every seen_listings read-modify-write
+SEEN_LOCK_FILE = SEEN_LISTINGS_FILE.with_suffix(".lock")
+# New hides are appended here as JSON ["player", "item_id"] lines and folded into the snapshot
+# once the log outgrows both the snapshot and SEEN_LOG_COMPACT_BYTES (or on any clear)
+SEEN_LOG_FILE = SEEN_LISTINGS_FILE.with_suffix(".log")
+SEEN_LOG_COMPACT_BYTES = 64 * 1024
 SOLD_PRICES_CACHE_FILE = Path("sold_prices_cache.json")
 SOLD_CACHE_DAYS = 7  # Refresh cache weekly
+SCAN_WORKERS = 4  # Players scanned concurrently, each worker with its own browser context
+# Seconds between page loads, shared by all workers: about one request a second overall
+REQUEST_INTERVAL = (0.8, 1.2)
+# After eBay throttles (429/503): seconds between page loads, doubled for every further
+# throttled response in a row (up to MAX_REQUEST_DELAY) until a page loads normally
+THROTTLED_INTERVAL = (3.0, 5.0)
+MAX_REQUEST_DELAY = 60.0
+# Auction searches that came back empty: search URL -> time of that scan. They are
+# skipped until AUCTION_EMPTY_SKIP_SECONDS have passed
+AUCTION_EMPTY_FILE = Path("auction_empty.json")
+# Emails held during quiet hours, one JSON object per line so queueing is an append
+EMAIL_QUEUE_FILE = Path("email_queue.ndjson")
+# Byte offset of the first queued email not yet sent, so an interrupted flush resumes there
+EMAIL_QUEUE_CURSOR_FILE = EMAIL_QUEUE_FILE.with_suffix(".cursor")
+LEGACY_EMAIL_QUEUE_FILE = Path("email_queue.json")  # Whole-list format used by older versions
+AUCTION_EMPTY_SKIP_SECONDS = 3600
+# Resource types the scraper never reads. Stylesheets stay: innerText depends on them.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "texttrack", "manifest", "eventsource"}
+# Fetch search results over plain HTTP first; the browser is only used when eBay answers
+# with something other than a results page (e.g. a bot challenge)
+HTTP_FAST_PATH = True
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
 
 # ============================================
 
+_PRICE_RE = re.compile(r'\$?(\d+(?:\.\d+)?|\.\d+)')
+_ITM_RE = re.compile(r'/itm/(\d+)')
+_TIME_RE = re.compile(r'(\d+)\s*([dhm])')
+_BID_RE = re.compile(r'(\d+)\s*bid')
+_NUMBERED_RE = re.compile(r'/(\d+)')
+_OR_GROUP_RE = re.compile(r"\((['\"][^)]+['\"])\)")  # ('/275','/399') OR groups in a query
+_OR_VALUES_RE = re.compile(r"['\"]([^'\"]+)['\"]")
+_CARD_NUM_RE = re.compile(r'#\d+')
+_PRINT_RUN_RE = re.compile(r'/\d+')
+_WORD_RE = re.compile(r'[a-z0-9]+')
+_NUMBERED_WORD_RE = re.compile(r'\bnumbered\b', re.IGNORECASE)
+_SPACES_RE = re.compile(r'\s+')
+
+# Runs in the page: pulls the fields scrape_listings needs from every result card.
+# Placeholder "Shop on eBay" cards don't have a real item id attribute, so they are
+# dropped here to keep the payload small.
+_LISTINGS_JS = """
+nodes => {
+    const text = (el, sel) => {
+        const found = el.querySelector(sel);
+        return found ? found.innerText : null;
+    };
+    return nodes
+        .filter(n => n.id && n.id.startsWith("item"))
+        .map(n => {
+            const link = n.querySelector("a.s-card__link");
+            return {
+                id: n.id,
+                title: text(n, ".s-card__title"),
+                price: text(n, ".s-card__price"),
+                link: link ? link.getAttribute("href") : null,
+                // Rows are only substring-checked, so normalize them here rather than in Python
+                rows: Array.from(n.querySelectorAll(".s-card__attribute-row"),
+                                 r => r.innerText.trim().toLowerCase()),
+            };
+        });
+}
+"""
+
+# Runs in the page: true once a priced card (arg selector) has rendered, or once the page
+# has fully loaded without one, so empty result pages don't sit out the whole timeout
+_RESULTS_READY_JS = """
+selector => !!document.querySelector(selector) || document.readyState === "complete"
+"""
+
+# Runs in the page: card text and price for the first 30 sold results
+_SOLD_JS = """
+nodes => nodes.slice(0, 30).map(n => {
+    const price = n.querySelector(".s-card__price");
+    return {text: n.innerText, price: price ? price.innerText : null};
+})
+"""
+
+
+_HIDDEN_TEXT_SELECTOR = ", ".join([
+    ".clipped", "[hidden]", "script", "style", "template",
+    '[style*="display:none"]', '[style*="display: none"]',
+    '[style*="visibility:hidden"]', '[style*="visibility: hidden"]',
+])
+
+
+def _parse_listing_cards(html: str) -> list[dict] | None:
+    """Extract result cards from server-rendered search HTML, shaped like _LISTINGS_JS output.
+
+    Returns None if the page has no results container (a challenge or error page).
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    if soup.select_one(".srp-results") is None:
+        return None
+    # get_text() ignores CSS, so drop what innerText wouldn't show: screen-reader-only
+    # ("Opens in a new window or tab") and inline-hidden text
+    for hidden in soup.select(_HIDDEN_TEXT_SELECTOR):
+        hidden.decompose()
+
+    def text(el, sel):
+        found = el.select_one(sel)
+        return found.get_text(" ", strip=True) if found else None
+
+    items = []
+    for card in soup.select("li.s-card"):
+        card_id = card.get("id") or ""
+        if not card_id.startswith("item"):
+            continue
+        link = card.select_one("a.s-card__link")
+        items.append({
+            "id": card_id,
+            "title": text(card, ".s-card__title"),
+            "price": text(card, ".s-card__price"),
+            "link": link.get("href") if link else None,
+            "rows": [row.get_text(" ", strip=True).lower()
+                     for row in card.select(".s-card__attribute-row")],
+        })
+    return items
+
+
+@functools.lru_cache(maxsize=256)
+def _build_search_url(query: str, auction: bool) -> str:
+    """Build the eBay search URL for a watchlist query (cached per query)."""
+    # Exclusions and OR groups like ('/275','/399','/299') are filtered locally, so only
+    # the required terms go to eBay. Reuses the parsed query rather than re-scanning it.
+    params = {"_nkw": " ".join(_parse_query_terms(query).required)}
+    if auction:
+        # _sop=1 = ending soonest, LH_Auction=1 = auctions only
+        params.update(_sop=1, LH_Auction=1)
+    else:
+        # _sop=10 = newly listed, LH_BIN=1 = Buy It Now only
+        params.update(_sop=10, LH_BIN=1)
+    # urlencode keeps characters like '#' and '&' part of the search terms
+    return "https://www.ebay.com/sch/i.html?" + urlencode(params)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_price(price_text: str) -> float | None:
+    """Parse a price like '$1,234.56' or '$5.00 to $9.99' (cached; price strings repeat a lot)."""
+    if not price_text:
+        return None
+    price_text = price_text.replace(",", "").strip()
+    if " to " in price_text.lower():
+        price_text = price_text.lower().split(" to ")[0]
+    match = _PRICE_RE.search(price_text)
+    if match:
+        try:
+            return float(match.group(1))
+        except ValueError:
+            return None
+    return None
+
+
+class ParsedQuery(NamedTuple):
+    """A watchlist query split into lowercase terms for local title matching."""
+    or_groups: tuple[tuple[str, ...], ...]  # Title needs at least one value from each group
+    required: tuple[str, ...]
+    excluded: tuple[str, ...]  # From -term, without the minus
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_query_terms(query: str) -> ParsedQuery:
+    """Parse a query into a ParsedQuery once; cached, so every listing reuses it."""
+    # Extract OR groups like ('/275','/399','/299')
+    or_groups = []
+    for group in _OR_GROUP_RE.findall(query):
+        # Parse the values from the group: '/275','/399' -> ('/275', '/399')
+        values = tuple(v.lower() for v in _OR_VALUES_RE.findall(group))
+        if values:
+            or_groups.append(values)
+
+    # Remove OR groups from query for regular term matching
+    clean_query = _OR_GROUP_RE.sub("", query)
+    required = []
+    excluded = []
+    for term in clean_query.lower().split():
+        if term.startswith("-"):
+            excluded.append(term[1:])
+        else:
+            required.append(term)
+
+    return ParsedQuery(tuple(or_groups), tuple(required), tuple(excluded))
+
+
+def _title_matches_terms(title: str, terms: ParsedQuery) -> bool:
+    """Check a title against a ParsedQuery."""
+    title_lower = title.lower()
+
+    # At least one value of each OR group must be in the title
+    for values in terms.or_groups:
+        if not any(v in title_lower for v in values):
+            return False
+    # Required terms must be in title, exclusion terms must NOT be
+    if not all(term in title_lower for term in terms.required):
+        return False
+    if any(term in title_lower for term in terms.excluded):
+        return False
+
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def _query_automaton(query: str):
+    """Compile a query for one-pass matching, or None without pyahocorasick.
+
+    Returns (automaton, required_mask, excluded_mask, or_masks): every distinct term gets
+    a bit, the automaton yields each found term's bit, and the masks say which bits a
+    title needs, must not have, and needs at least one of per OR group.
+    """
+    if ahocorasick is None:
+        return None
+    or_groups, required, excluded = _parse_query_terms(query)
+    bits = {}
+    for word in (*(v for values in or_groups for v in values), *required, *excluded):
+        bits.setdefault(word, 1 << len(bits))
+    # An empty term (a bare "-") matches everything; leave that to the substring path
+    if not bits or "" in bits:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word, bit in bits.items():
+        automaton.add_word(word, bit)
+    automaton.make_automaton()
+
+    def mask(words):
+        result = 0
+        for word in words:
+            result |= bits[word]
+        return result
+
+    return (automaton, mask(required), mask(excluded),
+            tuple(mask(values) for values in or_groups))
+
+
+@functools.lru_cache(maxsize=8192)
+def _title_matches_all_terms(title: str, query: str) -> bool:
+    """Cached title/query match; the same titles come back across searches and scans."""
+    compiled = _query_automaton(query)
+    if compiled is None:
+        return _title_matches_terms(title, _parse_query_terms(query))
+
+    # One scan of the title finds every term it contains
+    automaton, required_mask, excluded_mask, or_masks = compiled
+    found = 0
+    for _, bit in automaton.iter(title.lower()):
+        found |= bit
+    return (found & required_mask == required_mask
+            and not found & excluded_mask
+            and all(found & or_mask for or_mask in or_masks))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_time_remaining(time_text: str) -> int | None:
+    """Parse '1d 2h' / '5h 30m' style text into hours (cached; auction rows repeat a lot)."""
+    if not time_text:
+        return None
+    time_text = time_text.lower()
+
+    hours = 0
+    # Match patterns like "1d 2h", "5h 30m", "2d", "12h"
+    for match in _TIME_RE.finditer(time_text):
+        value, unit = int(match.group(1)), match.group(2)
+        if unit == "d":
+            hours += value * 24
+        elif unit == "h":
+            hours += value
+        else:
+            hours += value / 60
+
+    return hours if hours > 0 else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_bid_count(bid_text: str) -> int:
+    """Parse a bid count from text like '0 bids' (cached; most rows read the same)."""
+    if not bid_text:
+        return 0
+    match = _BID_RE.search(bid_text.lower())
+    return int(match.group(1)) if match else 0
+
+
+
+def _index_tiers(tiers: list[dict]) -> tuple[list, list]:
+    """Sort (non-overlapping) price tiers by "min" so _find_tier can bisect them."""
+    ordered = sorted(tiers, key=lambda t: t["min"])
+    return [t["min"] for t in ordered], ordered
+
+
+def _find_tier(tier_index: tuple[list, list], number: int) -> dict | None:
+    """Return the tier whose min-max range contains number, or None."""
+    mins, ordered = tier_index
+    # The only candidate is the last tier starting at or below number
+    i = bisect.bisect_right(mins, number) - 1
+    if i >= 0 and number <= ordered[i]["max"]:
+        return ordered[i]
+    return None
+
+
+def _read_seen_log(data: bytes):
+    """Yield (player, item_id) for each line of the seen log.
+
+    Lines are JSON ["player", "item_id"] arrays, so any player name round-trips; older
+    logs used "player\titem_id" lines, which are still read.
+    """
+    for line in data.split(b"\n"):
+        if line.startswith(b"["):
+            try:
+                player, item_id = _json_loads(line)
+                yield player, item_id
+                continue
+            except ValueError:
+                pass  # An older tab-separated line, or one cut short by a crash mid-append
+        player, sep, item_id = line.decode(errors="replace").partition("\t")
+        if sep:
+            yield player, item_id
+
+
+def _seen_log_prefix(f) -> bytes:
+    """A newline if the log (opened "a+b") ends mid-line, e.g. after a crash mid-append."""
+    if not f.tell():
+        return b""
+    f.seek(-1, os.SEEK_END)
+    return b"" if f.read(1) == b"\n" else b"\n"
+
+
+def _seen_key(item_id: str) -> int | str:
+    """Seen-set key for an item id: an int for numeric eBay ids, which hash and store smaller."""
+    # Only canonical ASCII numbers, so str(key) always gives back the original id
+    if item_id.isascii() and item_id.isdigit() and item_id[0] != "0":
+        return int(item_id)
+    return item_id
+
 
 class EbayCardMonitor:
     def __init__(self):
-        self.seen_listings = self._load_seen_listings()  # dict: player_name -> set of item_ids
+        self.seen_listings = self._load_seen_listings()  # dict: player_name -> frozenset of item_ids
+        self._seen_new = {}  # player_name -> set of item_ids hidden since load
         self.seen_this_run = {}  # item_id -> list of queries that matched
-        self.current_player = None  # Set during run_scan for each player
+        self._scrapes = {}  # search URL (lowercased) -> task scraping it, shared within a scan
+        self._auction_empty = {}  # search URL (lowercased) -> time it last had no auctions
+        self._throttled = 0  # Throttled (429/503) responses in a row; widens the request interval
+        self._next_request_at = 0.0  # time.monotonic() before which no page load may start
+        self._smtp = None  # SMTP session shared by all emails sent during a scan
+        self._workers = []  # (context, (page, auction_page)) per scan worker, reused by daemon scans
+        self._http = requests.Session() if HTTP_AVAILABLE else None  # Keeps eBay's connection and cookies
+        self._http_blocked = False  # Set once eBay refuses a plain fetch; browser only for the rest of the scan
 
     def extract_numbered_value(self, title: str) -> int | None:
         """Extract the numbered value from a card title like '/75' or '/299'.
@@ -67,8 +451,11 @@ class EbayCardMonitor:
         Looks for patterns like /75, /299, #/50, etc. and returns the number.
         Returns the smallest number found (most valuable).
         """
+        # Most titles have no print run at all; skip the regex for them
+        if "/" not in title:
+            return None
         # Match patterns like /75, /299, #/50, numbered /25
-        matches = re.findall(r'/(\d+)', title)
+        matches = _NUMBERED_RE.findall(title)
         if matches:
             # Return the smallest number (most valuable/rare)
             return min(int(m) for m in matches)
@@ -80,74 +467,149 @@ class EbayCardMonitor:
         Tiers format: [{"min": 1, "max": 24, "price": 150.00}, ...]
         Returns the price if number falls within a tier, None otherwise.
         """
-        for tier in tiers:
-            if tier["min"] <= number <= tier["max"]:
-                return tier["price"]
-        return None
+        tier = _find_tier(_index_tiers(tiers), number)
+        return tier["price"] if tier else None
 
     def _load_seen_listings(self) -> dict:
-        """Load seen listings as dict: player_name -> set of item_ids."""
+        """Load seen listings as dict: player_name -> frozenset of item_ids."""
+        seen = {}
         if SEEN_LISTINGS_FILE.exists():
-            with open(SEEN_LISTINGS_FILE, "r") as f:
-                data = json.load(f)
-                # Handle old format (list) - migrate to new format
-                if isinstance(data, list):
-                    return {"_legacy": set(data)}
+            data = _json_loads(SEEN_LISTINGS_FILE.read_bytes())
+            # Handle old format (list) - migrate to new format
+            if isinstance(data, list):
+                seen = {"_legacy": set(map(_seen_key, data))}
+            else:
                 # New format: dict of player -> list of ids
-                return {player: set(ids) for player, ids in data.items()}
-        return {}
+                seen = {player: set(map(_seen_key, ids)) for player, ids in data.items()}
+        # Replay hides appended since the snapshot was written
+        if SEEN_LOG_FILE.exists():
+            for player, item_id in _read_seen_log(SEEN_LOG_FILE.read_bytes()):
+                seen.setdefault(player, set()).add(_seen_key(item_id))
+        return {player: frozenset(ids) for player, ids in seen.items()}
+
+    def _write_seen_listings(self, seen: dict):
+        """Write player_name -> item_ids to disk as a fresh snapshot, emptying the log."""
+        # Convert sets to lists of strings for JSON serialization (the clear server reads them too)
+        data = {player: [str(item_id) for item_id in ids] for player, ids in seen.items()}
+        # Write to a temp file and rename so a crash can't leave a truncated file
+        tmp = SEEN_LISTINGS_FILE.with_suffix(".json.tmp")
+        tmp.write_bytes(_json_dumps(data))
+        os.replace(tmp, SEEN_LISTINGS_FILE)
+        # Everything in the log is now in the snapshot
+        SEEN_LOG_FILE.unlink(missing_ok=True)
+
+    def _append_seen_log(self, entries: list[tuple[str, str]]):
+        """Append (player, item_id) hides to the log without rewriting the snapshot."""
+        with open(SEEN_LOG_FILE, "a+b") as f:
+            f.write(_seen_log_prefix(f) + b"".join(_json_dumps([player, str(item_id)]) + b"\n"
+                                                   for player, item_id in entries))
+
+    @contextmanager
+    def _seen_lock(self):
+        """Hold the seen_listings lock (shared with the clear server) for a read-modify-write."""
+        with open(SEEN_LOCK_FILE, "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            yield
+
+    def _seen_log_needs_compaction(self) -> bool:
+        """True once the log outgrows both SEEN_LOG_COMPACT_BYTES and the snapshot itself."""
+        try:
+            log_size = SEEN_LOG_FILE.stat().st_size
+        except FileNotFoundError:
+            return False
+        try:
+            snapshot_size = SEEN_LISTINGS_FILE.stat().st_size
+        except FileNotFoundError:
+            snapshot_size = 0
+        # Compacting in proportion to the snapshot keeps rewrites amortized O(1) per hide
+        return log_size >= max(SEEN_LOG_COMPACT_BYTES, snapshot_size)
 
     def _save_seen_listings(self):
-        # Merge in any hides added by the clear server during the scan
-        disk_data = self._load_seen_listings()
-        for player, ids in disk_data.items():
-            if player in self.seen_listings:
-                self.seen_listings[player] |= ids
-            else:
-                self.seen_listings[player] = ids
-        with open(SEEN_LISTINGS_FILE, "w") as f:
-            # Convert sets to lists for JSON serialization
-            data = {player: list(ids) for player, ids in self.seen_listings.items()}
-            json.dump(data, f)
-
-    def _get_player_seen(self) -> set:
-        """Get seen item IDs for current player."""
-        if self.current_player is None:
-            return set()
-        return self.seen_listings.get(self.current_player, set())
-
-    def _mark_seen(self, item_id: str):
-        """Mark an item as seen for current player."""
-        if self.current_player is None or not item_id:
+        """Persist items hidden since load and compact the log if it has grown large.
+
+        No-op if nothing new was hidden and the log is still small.
+        """
+        # The clear server only ever appends, so its hides are compacted here too
+        if not self._seen_new and not self._seen_log_needs_compaction():
             return
-        if self.current_player not in self.seen_listings:
-            self.seen_listings[self.current_player] = set()
-        self.seen_listings[self.current_player].add(item_id)
+        with self._seen_lock():
+            # Merge in any hides added by the clear server during the scan
+            seen = self._load_seen_listings()
+            entries = []
+            for player, ids in self._seen_new.items():
+                on_disk = seen.get(player, frozenset())
+                added = ids - on_disk
+                if added:
+                    seen[player] = on_disk | added
+                    entries.extend((player, item_id) for item_id in added)
+            # Only append the new ids, unless the log is due for compaction;
+            # skip the write entirely when every new id was already on disk
+            if self._seen_log_needs_compaction():
+                self._write_seen_listings(seen)
+            elif entries:
+                self._append_seen_log(entries)
+        self.seen_listings = seen
+        self._seen_new = {}
+
+    def _get_player_seen(self, player: str) -> frozenset:
+        """Get seen item IDs for a player (as _seen_key() values)."""
+        seen = self.seen_listings.get(player, frozenset())
+        new = self._seen_new.get(player)
+        return seen | new if new else seen
+
+    def _mark_seen(self, player: str, item_id: str):
+        """Mark an item as seen for a player."""
+        if not item_id:
+            return
+        self._seen_new.setdefault(player, set()).add(_seen_key(item_id))
 
     def clear_player_history(self, player_name: str) -> bool:
         """Clear seen listings history for a specific player."""
-        if player_name in self.seen_listings:
-            count = len(self.seen_listings[player_name])
-            del self.seen_listings[player_name]
-            self._save_seen_listings()
-            print(f"Cleared {count} items from {player_name}'s history.")
-            return True
-        else:
-            print(f"No history found for {player_name}.")
-            return False
+        with self._seen_lock():
+            seen = self._load_seen_listings()
+            if player_name not in seen:
+                print(f"No history found for {player_name}.")
+                return False
+            count = len(seen.pop(player_name))
+            self._write_seen_listings(seen)
+        self.seen_listings = seen
+        self._seen_new.pop(player_name, None)
+        print(f"Cleared {count} items from {player_name}'s history.")
+        return True
+
+    def clear_all_history(self):
+        """Clear seen listings history for every player."""
+        with self._seen_lock():
+            if self._load_seen_listings():
+                self._write_seen_listings({})
+        self.seen_listings = {}
+        self._seen_new = {}
+
+    # ============== EMPTY AUCTION SEARCHES ==============
+
+    def _load_auction_empty(self) -> dict:
+        """Load search URL -> timestamp of auction searches that recently had no results."""
+        if AUCTION_EMPTY_FILE.exists():
+            now = time.time()
+            data = _json_loads(AUCTION_EMPTY_FILE.read_bytes())
+            # Drop entries that no longer cause a skip
+            return {url: ts for url, ts in data.items() if now - ts < AUCTION_EMPTY_SKIP_SECONDS}
+        return {}
+
+    def _save_auction_empty(self):
+        if self._auction_empty or AUCTION_EMPTY_FILE.exists():
+            AUCTION_EMPTY_FILE.write_bytes(_json_dumps(self._auction_empty))
 
     # ============== SOLD PRICES CACHE ==============
 
     def _load_sold_cache(self) -> dict:
         """Load sold prices cache: query -> {avg_price, num_sold, updated}."""
         if SOLD_PRICES_CACHE_FILE.exists():
-            with open(SOLD_PRICES_CACHE_FILE, "r") as f:
-                return json.load(f)
+            return _json_loads(SOLD_PRICES_CACHE_FILE.read_bytes())
         return {}
 
     def _save_sold_cache(self, cache: dict):
-        with open(SOLD_PRICES_CACHE_FILE, "w") as f:
-            json.dump(cache, f, indent=2)
+        SOLD_PRICES_CACHE_FILE.write_bytes(_json_dumps(cache, indent=True))
 
     def _get_cache_key(self, title: str) -> str:
         """Generate precise cache key from listing title for sold price lookup.
@@ -168,8 +630,8 @@ class EbayCardMonitor:
         ]
 
         # Extract card numbers before normalization
-        card_nums = re.findall(r'#\d+', title)
-        numbered = re.findall(r'/\d+', title)
+        card_nums = _CARD_NUM_RE.findall(title)
+        numbered = _PRINT_RUN_RE.findall(title)
 
         # Words that are noise
         noise = {'the', 'a', 'an', 'and', 'or', 'of', 'for', 'to', 'in', 'on',
@@ -186,7 +648,7 @@ class EbayCardMonitor:
                       'psa', 'bgs', 'sgc', 'cgc', '10', '9', '8'}
 
         # Extract words, keeping alphanumeric
-        words = re.findall(r'[a-z0-9]+', title)
+        words = _WORD_RE.findall(title)
 
         # Build key: keep player name words + important terms
         key_words = []
@@ -232,9 +694,9 @@ class EbayCardMonitor:
     def _get_tier_sold_key(self, numbered_query: str, tier: dict) -> str:
         """Generate a sold cache key for a specific tier of a numbered search."""
         # Remove 'numbered' from the query
-        base = re.sub(r'\bnumbered\b', '', numbered_query, flags=re.IGNORECASE).strip()
+        base = _NUMBERED_WORD_RE.sub('', numbered_query).strip()
         # Clean up extra spaces
-        base = re.sub(r'\s+', ' ', base)
+        base = _SPACES_RE.sub(' ', base)
         print_run = self._get_common_print_run(tier)
         # Split into include and exclude terms
         include = [t for t in base.split() if not t.startswith('-')]
@@ -256,50 +718,105 @@ class EbayCardMonitor:
         exclude_terms = [t[1:] for t in terms if t.startswith("-")]  # Remove the -
 
         # Build the query with exclusions
-        encoded_query = "+".join(include_terms)
-        for exc in exclude_terms:
-            encoded_query += f"+-{exc}"
+        nkw = " ".join(include_terms + [f"-{exc}" for exc in exclude_terms])
 
         # LH_Sold=1 and LH_Complete=1 for sold listings, _sop=13 for most recent
-        return f"https://www.ebay.com/sch/i.html?_nkw={encoded_query}&LH_Sold=1&LH_Complete=1&_sop=13&LH_PrefLoc=1"
+        params = {"_nkw": nkw, "LH_Sold": 1, "LH_Complete": 1, "_sop": 13, "LH_PrefLoc": 1}
+        return "https://www.ebay.com/sch/i.html?" + urlencode(params)
+
+    async def _goto(self, page, url: str):
+        """Navigate to url, noting eBay's response status to pick the next delay."""
+        await self._pace_request()
+        response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        if response is not None:
+            self._record_status(response.status)
+        return response
+
+    def _fetch_search_html(self, url: str) -> tuple[int | None, str | None]:
+        """GET a search page without the browser: (HTTP status, body), or (None, None)."""
+        try:
+            response = self._http.get(url, headers={"User-Agent": USER_AGENT}, timeout=15)
+        except requests.RequestException:
+            return None, None
+        return response.status_code, response.text
 
-    def scrape_sold_prices(self, page, query: str) -> dict | None:
+    def _fetch_listing_cards(self, url: str) -> tuple[int | None, list[dict] | None]:
+        """Fetch a search page without the browser.
+
+        Returns (HTTP status, cards); cards is None if eBay didn't serve real results.
+        """
+        status, html = self._fetch_search_html(url)
+        if status != 200:
+            return status, None
+        return status, _parse_listing_cards(html)
+
+    def _record_status(self, status: int):
+        """Back off while eBay throttles (429/503); return to REQUEST_INTERVAL once it stops."""
+        if status in (429, 503):
+            self._throttled += 1
+        elif status == 200:
+            self._throttled = 0
+
+    def _request_delay(self) -> float:
+        """Seconds between page loads: REQUEST_INTERVAL, or a growing delay while throttled."""
+        if not self._throttled:
+            return random.uniform(*REQUEST_INTERVAL)
+        # Capped exponent: the delay is clamped to MAX_REQUEST_DELAY well before this anyway
+        delay = random.uniform(*THROTTLED_INTERVAL) * 2 ** min(self._throttled - 1, 8)
+        return min(delay, MAX_REQUEST_DELAY)
+
+    async def _pace_request(self):
+        """Rate-limit page loads across all workers instead of sleeping after every search.
+
+        Each call claims the next free slot, so concurrent workers queue up behind each
+        other while a lone worker only waits for whatever gap remains.
+        """
+        now = time.monotonic()
+        slot = max(now, self._next_request_at)
+        # No await between reading and claiming the slot, so workers can't take the same one
+        self._next_request_at = slot + self._request_delay()
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def scrape_sold_prices(self, page, query: str) -> dict | None:
         """Scrape sold listings and return average price info."""
         url = self.build_sold_search_url(query)
         prices = []
 
         try:
-            page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            page.wait_for_selector(".srp-results", timeout=10000)
-            time.sleep(1.5)
-
-            items = page.query_selector_all("li.s-card")
-
-            for item in items[:30]:  # Check up to 30 items to get 20 valid sold
-                try:
-                    # Skip sponsored/ad items - real sold items have "Sold" in text
-                    item_text = item.inner_text()
-                    if "Sold" not in item_text or "Shop on eBay" in item_text:
-                        continue
-
-                    # Use the correct price selector for sold listings
-                    price_el = item.query_selector(".s-card__price")
-                    if not price_el:
-                        continue
+            await self._goto(page, url)
+            await page.wait_for_selector(".srp-results", timeout=10000)
+            # Wait for a rendered sold price instead of a fixed delay
+            try:
+                await page.wait_for_function(_RESULTS_READY_JS, arg="li.s-card .s-card__price",
+                                             timeout=5000, polling=100)
+            except PlaywrightTimeoutError:
+                pass
+
+            # Pull every card's text and price in one round-trip instead of per element
+            items = await page.eval_on_selector_all("li.s-card", _SOLD_JS)
+
+            for item in items:  # Check up to 30 items to get 20 valid sold
+                # Skip sponsored/ad items - real sold items have "Sold" in text
+                item_text = item["text"] or ""
+                if "Sold" not in item_text or "Shop on eBay" in item_text:
+                    continue
 
-                    price_text = price_el.inner_text()
-                    # Skip price ranges
-                    if " to " in price_text.lower():
-                        continue
+                # Use the correct price selector for sold listings
+                price_text = item["price"]
+                if not price_text:
+                    continue
 
-                    price = self.parse_price(price_text)
-                    if price and price > 0:
-                        prices.append(price)
-                        if len(prices) >= 20:
-                            break
-                except:
+                # Skip price ranges
+                if " to " in price_text.lower():
                     continue
 
+                price = self.parse_price(price_text)
+                if price and price > 0:
+                    prices.append(price)
+                    if len(prices) >= 20:
+                        break
+
             if prices:
                 return {
                     "avg_price": round(sum(prices) / len(prices), 2),
@@ -311,7 +828,7 @@ class EbayCardMonitor:
 
         return None
 
-    def get_sold_price(self, page, title: str, force_refresh: bool = False) -> dict | None:
+    async def get_sold_price(self, page, title: str, force_refresh: bool = False) -> dict | None:
         """Get sold price from cache or fetch fresh."""
         cache_key = self._get_cache_key(title)
         if not cache_key:
@@ -326,7 +843,7 @@ class EbayCardMonitor:
                 return entry
 
         # Fetch fresh data
-        result = self.scrape_sold_prices(page, cache_key)
+        result = await self.scrape_sold_prices(page, cache_key)
         if result:
             cache[cache_key] = result
             self._save_sold_cache(cache)
@@ -337,119 +854,114 @@ class EbayCardMonitor:
     # ============================================
 
     def build_search_url(self, query: str, auction: bool = False) -> str:
-        # Remove exclusion terms and OR groups from eBay search (we filter locally)
-        # OR groups look like: ('/275','/399','/299')
-        clean_query = re.sub(r"\(['\"][^)]+['\"]\)", "", query)  # Remove OR groups
-        search_terms = [t for t in clean_query.split() if t and not t.startswith("-")]
-        encoded_query = "+".join(search_terms)
-        if auction:
-            # _sop=1 = ending soonest, LH_Auction=1 = auctions only
-            return f"https://www.ebay.com/sch/i.html?_nkw={encoded_query}&_sop=1&LH_Auction=1"
-        else:
-            # _sop=10 = newly listed, LH_BIN=1 = Buy It Now only
-            return f"https://www.ebay.com/sch/i.html?_nkw={encoded_query}&_sop=10&LH_BIN=1"
+        return _build_search_url(query, auction)
 
     def parse_price(self, price_text: str) -> float | None:
-        if not price_text:
-            return None
-        price_text = price_text.replace(",", "").strip()
-        if " to " in price_text.lower():
-            price_text = price_text.lower().split(" to ")[0]
-        match = re.search(r'\$?([\d.]+)', price_text)
-        if match:
-            try:
-                return float(match.group(1))
-            except ValueError:
-                return None
-        return None
+        return _parse_price(price_text)
 
     def parse_time_remaining(self, time_text: str) -> int | None:
         """Parse time remaining text and return hours left, or None if can't parse."""
-        if not time_text:
-            return None
-        time_text = time_text.lower()
-
-        hours = 0
-        # Match patterns like "1d 2h", "5h 30m", "2d", "12h"
-        day_match = re.search(r'(\d+)\s*d', time_text)
-        hour_match = re.search(r'(\d+)\s*h', time_text)
-        min_match = re.search(r'(\d+)\s*m', time_text)
-
-        if day_match:
-            hours += int(day_match.group(1)) * 24
-        if hour_match:
-            hours += int(hour_match.group(1))
-        if min_match:
-            hours += int(min_match.group(1)) / 60
-
-        return hours if hours > 0 else None
+        return _parse_time_remaining(time_text)
 
     def parse_bid_count(self, bid_text: str) -> int:
         """Parse bid count from text like '0 bids' or '3 bids'."""
-        if not bid_text:
-            return 0
-        match = re.search(r'(\d+)\s*bid', bid_text.lower())
-        return int(match.group(1)) if match else 0
+        return _parse_bid_count(bid_text)
+
+    async def scrape_listings(self, page, query: str, auction: bool = False) -> list[dict]:
+        """Scrape eBay search results, once per scan for queries that search the same thing.
 
-    def scrape_listings(self, page, query: str, auction: bool = False) -> list[dict]:
-        """Scrape eBay search results."""
+        Exclusions and OR groups are filtered locally, so e.g. "x y -z" and "X Y" share one
+        page load. Callers get their own copies of the listings to annotate.
+        """
         url = self.build_search_url(query, auction=auction)
+        # eBay search is case-insensitive
+        key = url.lower()
+        if auction and time.time() - self._auction_empty.get(key, 0) < AUCTION_EMPTY_SKIP_SECONDS:
+            print(f"   Skipping auctions for '{query}' (none found in the last hour)")
+            return []
+        task = self._scrapes.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._scrape_listings(page, url, query, auction))
+            self._scrapes[key] = task
+        return [dict(listing) for listing in await task]
+
+    async def _scrape_listings(self, page, url: str, query: str, auction: bool) -> list[dict]:
+        """Load one search results page and extract its listings."""
         listings = []
 
         try:
-            page.goto(url, wait_until="domcontentloaded", timeout=30000)
-
-            # Wait for results to load
-            page.wait_for_selector(".srp-results", timeout=15000)
-            time.sleep(2)  # Let JS finish rendering
+            items = None
+            if HTTP_FAST_PATH and HTTP_AVAILABLE and not self._http_blocked:
+                await self._pace_request()
+                status, items = await asyncio.to_thread(self._fetch_listing_cards, url)
+                if status is not None:
+                    self._record_status(status)
+                if items is None and not self._http_blocked:
+                    print("   Plain fetch blocked, using the browser for the rest of this scan")
+                    self._http_blocked = True
+
+            if items is None:
+                await self._goto(page, url)
+
+                # Wait for results to load
+                await page.wait_for_selector(".srp-results", timeout=15000)
+                # Wait until the first real card has a price rendered, rather than a fixed delay
+                try:
+                    await page.wait_for_function(_RESULTS_READY_JS, arg="li.s-card[id^='item'] .s-card__price",
+                                                 timeout=5000, polling=100)
+                except PlaywrightTimeoutError:
+                    pass
 
-            items = page.query_selector_all("li.s-card")
+                # Extract every card in one round-trip instead of several per card
+                items = await page.eval_on_selector_all("li.s-card", _LISTINGS_JS)
             print(f"   Found {len(items)} raw {'auctions' if auction else 'listings'}")
 
             for item in items:
                 try:
-                    # Skip placeholder "Shop on eBay" cards (they don't have a real item id attribute)
-                    item_id_attr = item.get_attribute("id")
-                    if not item_id_attr or not item_id_attr.startswith("item"):
-                        continue
-
-                    # Get title
-                    title_elem = item.query_selector(".s-card__title")
-                    if not title_elem:
-                        continue
-                    title = title_elem.inner_text().strip()
+                    item_id_attr = item["id"]
+                    title = (item["title"] or "").strip()
 
                     if not title or "Shop on eBay" in title:
                         continue
 
-                    # Get price
-                    price_elem = item.query_selector(".s-card__price")
-                    if not price_elem:
-                        continue
-                    price = self.parse_price(price_elem.inner_text())
+                    price = self.parse_price(item["price"])
                     if price is None:
                         continue
 
-                    # Get link
-                    link_elem = item.query_selector("a.s-card__link")
-                    link = link_elem.get_attribute("href") if link_elem else None
+                    link = item["link"]
 
                     # Extract item ID from id attribute or link
                     item_id = item_id_attr.replace("item", "") if item_id_attr else None
                     if not item_id and link and "/itm/" in link:
-                        match = re.search(r'/itm/(\d+)', link)
+                        match = _ITM_RE.search(link)
                         if match:
                             item_id = match.group(1)
 
-                    # Get shipping, location, and auction info from attribute rows
+                    rows = item["rows"]  # already trimmed and lowercased
+
+                    # Location rejects the most listings, so check it before parsing anything else
+                    location = next((row for row in reversed(rows) if "located in" in row), "")
+                    # Skip listings not from United States
+                    if "united states" not in location:
+                        continue
+                    # Skip China specifically
+                    if "china" in location:
+                        continue
+
+                    # Get shipping and auction info from attribute rows
                     shipping_cost = 0.0
                     bids = 0
                     time_left_hours = None
-                    location = ""
                     has_bid_info = False
-                    attr_rows = item.query_selector_all(".s-card__attribute-row")
-                    for row in attr_rows:
-                        row_text = row.inner_text().strip().lower()
+                    for row_text in rows:
+                        if "bid" in row_text:
+                            has_bid_info = True
+                            if not auction:
+                                break  # BIN search skips this listing anyway, no need to parse further
+                            bids = self.parse_bid_count(row_text)
+                            # Time is often in the same row as bids: "0 bids · Time left 23h 40m left"
+                            if "left" in row_text:
+                                time_left_hours = self.parse_time_remaining(row_text)
                         if "delivery" in row_text or "shipping" in row_text:
                             if "free" in row_text:
                                 shipping_cost = 0.0
@@ -457,21 +969,6 @@ class EbayCardMonitor:
                                 shipping_price = self.parse_price(row_text)
                                 if shipping_price:
                                     shipping_cost = shipping_price
-                        if "bid" in row_text:
-                            has_bid_info = True
-                            bids = self.parse_bid_count(row_text)
-                            # Time is often in the same row as bids: "0 bids · Time left 23h 40m left"
-                            if "left" in row_text:
-                                time_left_hours = self.parse_time_remaining(row_text)
-                        if "located in" in row_text:
-                            location = row_text
-
-                    # Skip listings not from United States
-                    if "united states" not in location:
-                        continue
-                    # Skip China specifically
-                    if "china" in location:
-                        continue
 
                     # For BIN searches, skip listings that show bid info (they're auctions with BIN option)
                     if not auction and has_bid_info:
@@ -496,11 +993,24 @@ class EbayCardMonitor:
                 except Exception:
                     continue
 
+            # Remember empty auction searches so the next scans can skip them for a while
+            if auction:
+                if listings:
+                    self._auction_empty.pop(url.lower(), None)
+                else:
+                    self._auction_empty[url.lower()] = time.time()
+
         except Exception as e:
             print(f"  ⚠️  Error fetching results for '{query}': {e}")
 
         return listings
 
+    def parse_query_terms(self, query: str) -> ParsedQuery:
+        return _parse_query_terms(query)
+
+    def title_matches_terms(self, title: str, terms: ParsedQuery) -> bool:
+        return _title_matches_terms(title, terms)
+
     def title_matches_all_terms(self, title: str, query: str) -> bool:
         """Check if the title contains all search terms from the query.
 
@@ -509,81 +1019,71 @@ class EbayCardMonitor:
         - OR groups in parentheses: "Victor Wembanyama ('/275','/99','/50')"
           matches if ANY of those values are in the title
         """
-        title_lower = title.lower()
-
-        # Extract and check OR groups like ('/275','/399','/299')
-        or_groups = re.findall(r"\((['\"][^)]+['\"])\)", query)
-        for group in or_groups:
-            # Parse the values from the group: '/275','/399' -> ['/275', '/399']
-            values = re.findall(r"['\"]([^'\"]+)['\"]", group)
-            # At least one value must be in the title
-            if values and not any(v.lower() in title_lower for v in values):
-                return False
+        return _title_matches_all_terms(title, query)
 
-        # Remove OR groups from query for regular term matching
-        clean_query = re.sub(r"\(['\"][^)]+['\"]\)", "", query)
-        terms = clean_query.lower().split()
-
-        for term in terms:
-            if not term:
-                continue
-            if term.startswith("-"):
-                # Exclusion term - must NOT be in title
-                exclude = term[1:]
-                if exclude in title_lower:
-                    return False
-            else:
-                # Required term - must be in title
-                if term not in title_lower:
-                    return False
-
-        return True
-
-    def find_deals(self, page, query: str, max_price: float) -> list[dict]:
-        listings = self.scrape_listings(page, query, auction=False)
+    async def find_deals(self, page, player: str, query: str, max_price: float) -> list[dict]:
+        listings = await self.scrape_listings(page, query, auction=False)
         deals = []
         seen_in_search = set()  # Dedupe within this search
+        # Persistent seen_listings (across runs) for BIN deals
+        # Items stay visible until manually hidden via link in email
+        player_seen = self._get_player_seen(player)
 
+        # Local bindings for the per-listing loop
+        matches = self.title_matches_all_terms
         for listing in listings:
-            if listing["price"] <= max_price:
-                if not self.title_matches_all_terms(listing["title"], query):
-                    continue
+            # Cheapest checks first: a hash lookup skips hidden items before any title matching
+            if listing["item_id"] and _seen_key(listing["item_id"]) in player_seen:
+                continue
+            if listing["price"] > max_price:
+                continue
+            if not matches(listing["title"], query):
+                continue
 
-                # Dedupe by item_id or link within this search
-                dedupe_key = listing["item_id"] or listing.get("link", "")
-                if dedupe_key in seen_in_search:
-                    continue
-                seen_in_search.add(dedupe_key)
+            # Dedupe by item_id or link within this search
+            dedupe_key = listing["item_id"] or listing.get("link", "")
+            if dedupe_key in seen_in_search:
+                continue
+            seen_in_search.add(dedupe_key)
 
-                # Check persistent seen_listings (across runs) for BIN deals
-                # Items stay visible until manually hidden via link in email
-                player_seen = self._get_player_seen()
-                if listing["item_id"] and listing["item_id"] not in player_seen:
-                    deals.append(listing)
-                elif not listing["item_id"]:
-                    deals.append(listing)
+            deals.append(listing)
 
         return deals
 
-    def find_tiered_deals(self, page, query: str, tiers: list[dict]) -> list[dict]:
+    async def find_tiered_deals(self, page, player: str, query: str, tiers: list[dict]) -> list[dict]:
         """Find BIN deals for numbered cards using price tiers."""
-        listings = self.scrape_listings(page, query, auction=False)
+        listings = await self.scrape_listings(page, query, auction=False)
         deals = []
         seen_in_search = set()  # Dedupe within this search
-
+        # Persistent seen_listings (across runs) for BIN deals
+        # Items stay visible until manually hidden via link in email
+        player_seen = self._get_player_seen(player)
+
+        # Local bindings for the per-listing loop
+        matches = self.title_matches_all_terms
+        extract_numbered = self.extract_numbered_value
+        tier_index = _index_tiers(tiers)
+        # No tier allows more than this, so pricier listings need no title or number parsing
+        max_tier_price = max((t["price"] for t in tiers), default=0)
         for listing in listings:
-            if not self.title_matches_all_terms(listing["title"], query):
+            # Skip hidden items before any title matching
+            if listing["item_id"] and _seen_key(listing["item_id"]) in player_seen:
+                continue
+            if listing["price"] > max_tier_price:
+                continue
+            if not matches(listing["title"], query):
                 continue
 
             # Extract the numbered value from title
-            numbered = self.extract_numbered_value(listing["title"])
+            numbered = extract_numbered(listing["title"])
             if numbered is None:
                 continue  # Skip if no number found
 
-            # Get the max price for this tier
-            tier_price = self.get_tier_price(tiers, numbered)
-            if tier_price is None:
+            # Get the tier (and its max price) this number falls in
+            tier = _find_tier(tier_index, numbered)
+            if tier is None:
                 continue  # Number doesn't fall in any tier
+            tier_price = tier["price"]
 
             # Dedupe by item_id or link within this search
             dedupe_key = listing["item_id"] or listing.get("link", "")
@@ -595,22 +1095,15 @@ class EbayCardMonitor:
                 listing["numbered"] = numbered
                 listing["tier_price"] = tier_price
                 # Store matched tier for sold price lookups
-                matched_tier = next(t for t in tiers if t["min"] <= numbered <= t["max"])
-                listing["tier_max"] = matched_tier["max"]
+                listing["tier_max"] = tier["max"]
                 listing["numbered_query"] = query
-                # Check persistent seen_listings (across runs) for BIN deals
-                # Items stay visible until manually hidden via link in email
-                player_seen = self._get_player_seen()
-                if listing["item_id"] and listing["item_id"] not in player_seen:
-                    deals.append(listing)
-                elif not listing["item_id"]:
-                    deals.append(listing)
+                deals.append(listing)
 
         return deals
 
-    def find_auction_deals(self, page, query: str, max_price: float) -> list[dict]:
+    async def find_auction_deals(self, page, query: str, max_price: float) -> list[dict]:
         """Find auctions ending within 12h with price < max."""
-        listings = self.scrape_listings(page, query, auction=True)
+        listings = await self.scrape_listings(page, query, auction=True)
         deals = []
         seen_in_search = set()  # Dedupe within this search
 
@@ -621,6 +1114,8 @@ class EbayCardMonitor:
         filtered_time = 0
         filtered_title = 0
 
+        # Local bindings for the per-listing loop
+        matches = self.title_matches_all_terms
         for listing in listings:
             # Check criteria: price < max, ending within 12h
             if listing["price"] >= target_price:
@@ -629,7 +1124,7 @@ class EbayCardMonitor:
             if listing.get("time_left_hours") is None or listing["time_left_hours"] > 12:
                 filtered_time += 1
                 continue
-            if not self.title_matches_all_terms(listing["title"], query):
+            if not matches(listing["title"], query):
                 filtered_title += 1
                 continue
 
@@ -650,27 +1145,35 @@ class EbayCardMonitor:
 
         return deals
 
-    def find_tiered_auction_deals(self, page, query: str, tiers: list[dict]) -> list[dict]:
+    async def find_tiered_auction_deals(self, page, query: str, tiers: list[dict]) -> list[dict]:
         """Find auction deals for numbered cards using price tiers (ending within 12h)."""
-        listings = self.scrape_listings(page, query, auction=True)
+        listings = await self.scrape_listings(page, query, auction=True)
         deals = []
         seen_in_search = set()  # Dedupe within this search
 
+        # Local bindings for the per-listing loop
+        matches = self.title_matches_all_terms
+        extract_numbered = self.extract_numbered_value
+        tier_index = _index_tiers(tiers)
+        max_tier_price = max((t["price"] for t in tiers), default=0)
         for listing in listings:
+            if listing["price"] >= max_tier_price:
+                continue
             if listing.get("time_left_hours") is None or listing["time_left_hours"] > 12:
                 continue
-            if not self.title_matches_all_terms(listing["title"], query):
+            if not matches(listing["title"], query):
                 continue
 
             # Extract the numbered value from title
-            numbered = self.extract_numbered_value(listing["title"])
+            numbered = extract_numbered(listing["title"])
             if numbered is None:
                 continue
 
-            # Get the max price for this tier
-            tier_price = self.get_tier_price(tiers, numbered)
-            if tier_price is None:
+            # Get the tier (and its max price) this number falls in
+            tier = _find_tier(tier_index, numbered)
+            if tier is None:
                 continue
+            tier_price = tier["price"]
 
             # Dedupe by item_id or link within this search
             dedupe_key = listing["item_id"] or listing.get("link", "")
@@ -684,8 +1187,7 @@ class EbayCardMonitor:
                 listing["numbered"] = numbered
                 listing["tier_price"] = tier_price
                 # Store matched tier for sold price lookups
-                matched_tier = next(t for t in tiers if t["min"] <= numbered <= t["max"])
-                listing["tier_max"] = matched_tier["max"]
+                listing["tier_max"] = tier["max"]
                 listing["numbered_query"] = query
                 # Mark as DEAL if 0-2 bids and price < 50% of tier
                 listing["is_deal"] = listing.get("bids", 0) <= 2 and listing["price"] < (tier_price * 0.5)
@@ -693,138 +1195,371 @@ class EbayCardMonitor:
 
         return deals
 
-    def send_player_email(self, player: str, numbered_deals: list, numbered_auctions: list,
-                          other_deals: list, other_auctions: list):
-        """Send one email per player with all their deals organized by category."""
-        if not EMAIL_CONFIG["enabled"]:
-            return
-
-        total = len(numbered_deals) + len(numbered_auctions) + len(other_deals) + len(other_auctions)
-        if total == 0:
-            return
-
-        subject = f"🏀 {player}: {total} deal(s) found"
-
-        body = f"{'='*50}\n"
-        body += f"🏀 {player}\n"
-        body += f"{'='*50}\n\n"
+    def build_player_email_body(self, player: str, numbered_deals: list, numbered_auctions: list,
+                                other_deals: list, other_auctions: list) -> str:
+        """Build a player's section of the scan email, with deals organized by category."""
+        player_param = quote(player)
+        parts = [f"{'='*50}\n"]
+        parts.append(f"🏀 {player}\n")
+        parts.append(f"{'='*50}\n\n")
 
         # Numbered cards section (if any)
         if numbered_deals or numbered_auctions:
-            body += "📊 NUMBERED CARDS\n"
-            body += "-" * 30 + "\n\n"
+            parts.append("📊 NUMBERED CARDS\n")
+            parts.append("-" * 30 + "\n\n")
 
             if numbered_deals:
-                body += f"📦 BUY IT NOW ({len(numbered_deals)})\n\n"
+                parts.append(f"📦 BUY IT NOW ({len(numbered_deals)})\n\n")
                 for deal in numbered_deals:
-                    body += f"[/{deal.get('numbered', '?')}] {deal['title']}\n"
-                    body += f"   ${deal['price']:.2f}"
+                    parts.append(f"[/{deal.get('numbered', '?')}] {deal['title']}\n")
+                    parts.append(f"   ${deal['price']:.2f}")
                     if deal['shipping'] > 0:
-                        body += f" + ${deal['shipping']:.2f} ship"
-                    body += f" (max ${deal.get('tier_price', 0):.2f})"
+                        parts.append(f" + ${deal['shipping']:.2f} ship")
+                    parts.append(f" (max ${deal.get('tier_price', 0):.2f})")
                     # Add sold price comparison
                     if deal.get('sold_info'):
                         avg = deal['sold_info']['avg_price']
                         diff = deal['price'] - avg
                         if diff < 0:
-                            body += f" | Avg sold: ${avg:.2f} (${abs(diff):.2f} below)"
+                            parts.append(f" | Avg sold: ${avg:.2f} (${abs(diff):.2f} below)")
                         else:
-                            body += f" | Avg sold: ${avg:.2f} (${diff:.2f} above)"
-                    body += "\n"
-                    body += f"   {deal['link']}\n"
+                            parts.append(f" | Avg sold: ${avg:.2f} (${diff:.2f} above)")
+                    parts.append("\n")
+                    parts.append(f"   {deal['link']}\n")
                     if deal.get('item_id'):
-                        from urllib.parse import quote
-                        body += f"   [Hide] http://localhost:5050/hide?player={quote(player)}&id={deal['item_id']}\n"
-                    body += "\n"
+                        parts.append(f"   [Hide] http://localhost:5050/hide?player={player_param}&id={deal['item_id']}\n")
+                    parts.append("\n")
 
             if numbered_auctions:
-                body += f"🔨 AUCTIONS ({len(numbered_auctions)})\n\n"
+                parts.append(f"🔨 AUCTIONS ({len(numbered_auctions)})\n\n")
                 for auction in numbered_auctions:
                     deal_tag = "🔥 DEAL! " if auction.get("is_deal") else ""
-                    body += f"{deal_tag}[/{auction.get('numbered', '?')}] {auction['title']}\n"
-                    body += f"   ${auction['price']:.2f}"
+                    parts.append(f"{deal_tag}[/{auction.get('numbered', '?')}] {auction['title']}\n")
+                    parts.append(f"   ${auction['price']:.2f}")
                     if auction['shipping'] > 0:
-                        body += f" + ${auction['shipping']:.2f} ship"
-                    body += f" ({auction.get('bids', 0)} bids"
+                        parts.append(f" + ${auction['shipping']:.2f} ship")
+                    parts.append(f" ({auction.get('bids', 0)} bids")
                     if auction.get('time_left_hours'):
                         hours = auction['time_left_hours']
                         if hours < 1:
-                            body += f", {int(hours * 60)}m left"
+                            parts.append(f", {int(hours * 60)}m left")
                         else:
-                            body += f", {hours:.1f}h left"
-                    body += f")\n   {auction['link']}\n\n"
+                            parts.append(f", {hours:.1f}h left")
+                    parts.append(f")\n   {auction['link']}\n\n")
 
         # Other searches section (if any)
         if other_deals or other_auctions:
-            body += "🔍 OTHER SEARCHES\n"
-            body += "-" * 30 + "\n\n"
+            parts.append("🔍 OTHER SEARCHES\n")
+            parts.append("-" * 30 + "\n\n")
 
             if other_deals:
-                body += f"📦 BUY IT NOW ({len(other_deals)})\n\n"
+                parts.append(f"📦 BUY IT NOW ({len(other_deals)})\n\n")
                 for deal in other_deals:
                     search_name = deal.get('search_query', '')[:30]
-                    body += f"[{search_name}] {deal['title']}\n"
-                    body += f"   ${deal['price']:.2f}"
+                    parts.append(f"[{search_name}] {deal['title']}\n")
+                    parts.append(f"   ${deal['price']:.2f}")
                     if deal['shipping'] > 0:
-                        body += f" + ${deal['shipping']:.2f} ship"
+                        parts.append(f" + ${deal['shipping']:.2f} ship")
                     # Add sold price comparison
                     if deal.get('sold_info'):
                         avg = deal['sold_info']['avg_price']
                         diff = deal['price'] - avg
                         if diff < 0:
-                            body += f" | Avg sold: ${avg:.2f} (${abs(diff):.2f} below)"
+                            parts.append(f" | Avg sold: ${avg:.2f} (${abs(diff):.2f} below)")
                         else:
-                            body += f" | Avg sold: ${avg:.2f} (${diff:.2f} above)"
-                    body += f"\n   {deal['link']}\n"
+                            parts.append(f" | Avg sold: ${avg:.2f} (${diff:.2f} above)")
+                    parts.append(f"\n   {deal['link']}\n")
                     if deal.get('item_id'):
-                        from urllib.parse import quote
-                        body += f"   [Hide] http://localhost:5050/hide?player={quote(player)}&id={deal['item_id']}\n"
-                    body += "\n"
+                        parts.append(f"   [Hide] http://localhost:5050/hide?player={player_param}&id={deal['item_id']}\n")
+                    parts.append("\n")
 
             if other_auctions:
-                body += f"🔨 AUCTIONS ({len(other_auctions)})\n\n"
+                parts.append(f"🔨 AUCTIONS ({len(other_auctions)})\n\n")
                 for auction in other_auctions:
                     deal_tag = "🔥 DEAL! " if auction.get("is_deal") else ""
                     search_name = auction.get('search_query', '')[:30]
-                    body += f"{deal_tag}[{search_name}] {auction['title']}\n"
-                    body += f"   ${auction['price']:.2f}"
+                    parts.append(f"{deal_tag}[{search_name}] {auction['title']}\n")
+                    parts.append(f"   ${auction['price']:.2f}")
                     if auction['shipping'] > 0:
-                        body += f" + ${auction['shipping']:.2f} ship"
-                    body += f" ({auction.get('bids', 0)} bids"
+                        parts.append(f" + ${auction['shipping']:.2f} ship")
+                    parts.append(f" ({auction.get('bids', 0)} bids")
                     if auction.get('time_left_hours'):
                         hours = auction['time_left_hours']
                         if hours < 1:
-                            body += f", {int(hours * 60)}m left"
+                            parts.append(f", {int(hours * 60)}m left")
                         else:
-                            body += f", {hours:.1f}h left"
-                    body += f")\n   {auction['link']}\n\n"
+                            parts.append(f", {hours:.1f}h left")
+                    parts.append(f")\n   {auction['link']}\n\n")
+
+        parts.append(f"\n{'='*50}\n")
+        parts.append(f"🗑️ Clear {player} history:\n")
+        parts.append(f"   python ebay_card_monitor.py --clear \"{player}\"\n")
+
+        return "".join(parts)
+
+    def send_scan_email(self, player_deals: list[tuple]):
+        """Send one email per scan covering every player with deals.
+
+        player_deals: [(player, numbered_deals, numbered_auctions, other_deals, other_auctions), ...]
+        """
+        if not EMAIL_CONFIG["enabled"] or not player_deals:
+            return
 
-        body += f"\n{'='*50}\n"
-        body += f"🗑️ Clear {player} history:\n"
-        body += f"   python ebay_card_monitor.py --clear \"{player}\"\n"
-        body += f"🗑️ Clear all history: http://localhost:5050/clear-all\n"
+        total = sum(len(d) for _, *lists in player_deals for d in lists)
+        players = [player for player, *_ in player_deals]
+        if len(players) == 1:
+            subject = f"🏀 {players[0]}: {total} deal(s) found"
+        else:
+            subject = f"🏀 {total} deal(s) found: {', '.join(players)}"
+
+        sections = [self.build_player_email_body(*deals) for deals in player_deals]
+        body = "\n".join(sections) + "🗑️ Clear all history: http://localhost:5050/clear-all\n"
 
         # Queue email during quiet hours (12am-6am)
         if self._is_quiet_hours():
             self._queue_email(subject, body)
             return
 
-        msg = MIMEMultipart()
+        msg = EmailMessage()
         msg["From"] = EMAIL_CONFIG["sender_email"]
         msg["To"] = EMAIL_CONFIG["recipient_email"]
         msg["Subject"] = subject
-        msg.attach(MIMEText(body, "plain"))
+        msg.set_content(body)
 
         try:
-            with smtplib.SMTP(EMAIL_CONFIG["smtp_server"], EMAIL_CONFIG["smtp_port"]) as server:
-                server.starttls()
-                server.login(EMAIL_CONFIG["sender_email"], EMAIL_CONFIG["sender_password"])
-                server.send_message(msg)
-            print(f"  📧 Email sent for {player}!")
+            self._send_message(msg)
+            print(f"  📧 Email sent for {', '.join(players)}!")
         except Exception as e:
             print(f"  ⚠️  Failed to send email: {e}")
 
-    def run_scan(self):
+    def _connect_smtp(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(EMAIL_CONFIG["smtp_server"], EMAIL_CONFIG["smtp_port"])
+        server.starttls()
+        server.login(EMAIL_CONFIG["sender_email"], EMAIL_CONFIG["sender_password"])
+        return server
+
+    def _send_message(self, msg):
+        """Send over the scan's SMTP session, opening it on first use."""
+        if self._smtp is None:
+            self._smtp = self._connect_smtp()
+        try:
+            self._smtp.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # Session dropped (e.g. idle timeout) - reconnect once and retry
+            self._smtp = self._connect_smtp()
+            self._smtp.send_message(msg)
+
+    def _close_smtp(self):
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except smtplib.SMTPException:
+            pass
+        self._smtp = None
+
+    async def _scan_players(self, browser, players: list, sold_cache: dict) -> list:
+        """Scan players concurrently on the worker contexts, creating any that are missing."""
+        # Contexts kept from an earlier scan (daemon mode) keep their connections but
+        # start without the last scan's cookies
+        for context, _ in self._workers:
+            await context.clear_cookies()
+        # One context per worker so concurrent scans don't share cookies or connections
+        while len(self._workers) < (min(SCAN_WORKERS, len(players)) or 1):
+            context = await self._new_context(browser)
+            # Each player borrows a worker's BIN/auction page pair for all of its searches
+            self._workers.append((context, (await context.new_page(), await context.new_page())))
+        print("Browser ready.\n")
+
+        pages = asyncio.Queue()
+        for _, page_pair in self._workers:
+            pages.put_nowait(page_pair)
+
+        async def scan(player, config):
+            page, auction_page = await pages.get()
+            try:
+                return await self.scan_player(page, auction_page, player, config, sold_cache)
+            finally:
+                pages.put_nowait((page, auction_page))
+
+        return await asyncio.gather(*(scan(player, config) for player, config in players))
+
+    async def _close_workers(self):
+        for context, _ in self._workers:
+            try:
+                await context.close()
+            except Exception:
+                pass  # Already gone with its browser
+        self._workers = []
+
+    async def run_daemon(self, interval: int):
+        """Scan every interval seconds, keeping one browser and its contexts warm between scans."""
+        async with async_playwright() as p:
+            browser = None
+            try:
+                while True:
+                    started = time.monotonic()
+                    if browser is None or not browser.is_connected():
+                        print("Starting browser...")
+                        await self._close_workers()
+                        browser = await p.chromium.launch(headless=True)
+                    # Pick up hides and clears made through the clear server since the last scan
+                    self.seen_listings = self._load_seen_listings()
+                    try:
+                        await self.run_scan(browser)
+                    except Exception as e:
+                        print(f"⚠️  Scan failed: {e}")
+                        # Start the next scan with fresh contexts
+                        await self._close_workers()
+                    await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
+            finally:
+                await self._close_workers()
+                if browser is not None:
+                    await browser.close()
+
+    async def _new_context(self, browser):
+        """Create a browser context with the scraper's user agent and resource blocking."""
+        context = await browser.new_context(
+            user_agent=USER_AGENT,
+            viewport={"width": 1920, "height": 1080}
+        )
+        await self._block_unused_resources(context)
+        return context
+
+    async def _block_unused_resources(self, context):
+        """Abort requests for BLOCKED_RESOURCE_TYPES on every page in the context."""
+        async def handle(route):
+            if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+                await route.abort()
+            else:
+                await route.continue_()
+        await context.route("**/*", handle)
+
+    async def scan_player(self, page, auction_page, player: str, config: dict,
+                          sold_cache: dict) -> tuple[list, list, list, list]:
+        """Run all of a player's searches, with BIN and auction results loading side by side.
+
+        Returns (numbered_deals, numbered_auctions, other_deals, other_auctions).
+        """
+        print(f"\n{'='*50}")
+        print(f"🏀 {player}")
+        print(f"{'='*50}")
+
+        # Reset per-player deduplication
+        player_seen = set()
+
+        # Collect all deals for this player
+        numbered_deals = []
+        numbered_auctions = []
+        other_deals = []
+        other_auctions = []
+
+        # Run numbered search first (if exists)
+        if "numbered" in config:
+            numbered_config = config["numbered"]
+            query = numbered_config["query"]
+            tiers = numbered_config["tiers"]
+            numbered_search_sold = numbered_config.get("search_sold", True)
+
+            print(f"\n   📊 [{player}] Numbered search: {query}")
+            min_price = min(t["price"] for t in tiers)
+            max_price = max(t["price"] for t in tiers)
+            print(f"      Tiers: ${min_price:.2f} - ${max_price:.2f}")
+
+            # BIN deals and auctions load in parallel on the worker's two pages
+            deals, auctions = await asyncio.gather(
+                self.find_tiered_deals(page, player, query, tiers),
+                self.find_tiered_auction_deals(auction_page, query, tiers),
+            )
+            for deal in deals:
+                dedupe_key = deal["item_id"] or deal.get("link", "")
+                if dedupe_key not in player_seen:
+                    player_seen.add(dedupe_key)
+                    deal["search_sold"] = numbered_search_sold
+                    numbered_deals.append(deal)
+
+            for auction in auctions:
+                dedupe_key = auction["item_id"] or auction.get("link", "")
+                if dedupe_key not in player_seen:
+                    player_seen.add(dedupe_key)
+                    numbered_auctions.append(auction)
+
+            if numbered_deals or numbered_auctions:
+                print(f"      ✅ [{player}] {len(numbered_deals)} BIN, {len(numbered_auctions)} auctions")
+            else:
+                print(f"      ❌ [{player}] No numbered deals")
+
+        # Run other searches
+        searches = config.get("searches", [])
+        for search in searches:
+            query = search["query"]
+            max_price = search["price"]
+
+            print(f"\n   🔍 [{player}] Search: {query}")
+            print(f"      Max: ${max_price:.2f}")
+
+            search_sold = search.get("search_sold", True)
+
+            # BIN deals and auctions load in parallel on the worker's two pages
+            deals, auctions = await asyncio.gather(
+                self.find_deals(page, player, query, max_price),
+                self.find_auction_deals(auction_page, query, max_price),
+            )
+            for deal in deals:
+                dedupe_key = deal["item_id"] or deal.get("link", "")
+                if dedupe_key not in player_seen:
+                    player_seen.add(dedupe_key)
+                    deal["search_query"] = query
+                    deal["search_sold"] = search_sold
+                    other_deals.append(deal)
+
+            for auction in auctions:
+                dedupe_key = auction["item_id"] or auction.get("link", "")
+                if dedupe_key not in player_seen:
+                    player_seen.add(dedupe_key)
+                    auction["search_query"] = query
+                    other_auctions.append(auction)
+
+            if deals or auctions:
+                new_deals = len([d for d in deals if d.get("search_query")])
+                new_auctions = len([a for a in auctions if a.get("search_query")])
+                print(f"      ✅ [{player}] {new_deals} BIN, {new_auctions} auctions (after dedupe)")
+            else:
+                print(f"      ❌ [{player}] No deals")
+
+        # Fetch sold prices for BIN deals (cached weekly)
+        all_bin_deals = numbered_deals + other_deals
+        sold_eligible = [d for d in all_bin_deals if d.get("search_sold", True)]
+        if sold_eligible:
+            print(f"\n   💰 [{player}] Fetching sold prices for {len(sold_eligible)} deals...")
+            cached_count = 0
+            fetched_count = 0
+            for deal in sold_eligible:
+                # Use tier-specific key for numbered deals, title-based for others
+                if deal.get("tier_max") and deal.get("numbered_query"):
+                    tier = {"min": 0, "max": deal["tier_max"]}  # Only max matters for key
+                    cache_key = self._get_tier_sold_key(deal["numbered_query"], tier)
+                else:
+                    cache_key = self._get_cache_key(deal['title'])
+                if cache_key in sold_cache and self._is_cache_valid(sold_cache[cache_key]):
+                    deal['sold_info'] = sold_cache[cache_key]
+                    cached_count += 1
+                else:
+                    result = await self.scrape_sold_prices(page, cache_key)
+                    if result:
+                        sold_cache[cache_key] = result
+                        self._save_sold_cache(sold_cache)
+                        deal['sold_info'] = result
+                        fetched_count += 1
+            print(f"      ✅ [{player}] {cached_count} cached, {fetched_count} fetched")
+
+        return numbered_deals, numbered_auctions, other_deals, other_auctions
+
+    async def run_scan(self, browser=None):
+        """Scan every active player and email the deals.
+
+        Launches its own browser unless one is passed in (daemon mode keeps one warm).
+        """
         print(f"\n{'='*60}")
         print(f"eBay Card Monitor - Scan Started")
         print(f"   {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -832,167 +1567,60 @@ class EbayCardMonitor:
 
         # Reset cross-search deduplication for this run
         self.seen_this_run = {}
+        self._scrapes = {}
+        self._http_blocked = False
+        self._auction_empty = self._load_auction_empty()
 
         total_deals = 0
         total_auctions = 0
 
-        with sync_playwright() as p:
-            print("Starting browser...")
-            browser = p.chromium.launch(headless=True)
-            print("Browser ready.\n")
-
-            watchlist = load_watchlist()
+        watchlist = load_watchlist()
+        players = []
+        for player, config in watchlist.items():
+            if not config.get("active", True):
+                print(f"\n   Skipping {player} (inactive)")
+                continue
+            players.append((player, config))
 
-            for player, config in watchlist.items():
-                if not config.get("active", True):
-                    print(f"\n   Skipping {player} (inactive)")
-                    continue
+        # Shared by all players so concurrent lookups don't overwrite each other's entries
+        sold_cache = self._load_sold_cache()
 
-                print(f"\n{'='*50}")
-                print(f"🏀 {player}")
-                print(f"{'='*50}")
-
-                # Set current player for seen_listings tracking
-                self.current_player = player
-
-                # Reset per-player deduplication
-                player_seen = set()
-
-                # Collect all deals for this player
-                numbered_deals = []
-                numbered_auctions = []
-                other_deals = []
-                other_auctions = []
-
-                # Create browser context for this player
-                context = browser.new_context(
-                    user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-                    viewport={"width": 1920, "height": 1080}
-                )
-                page = context.new_page()
-
-                # Run numbered search first (if exists)
-                if "numbered" in config:
-                    numbered_config = config["numbered"]
-                    query = numbered_config["query"]
-                    tiers = numbered_config["tiers"]
-                    numbered_search_sold = numbered_config.get("search_sold", True)
-
-                    print(f"\n   📊 Numbered search: {query}")
-                    min_price = min(t["price"] for t in tiers)
-                    max_price = max(t["price"] for t in tiers)
-                    print(f"      Tiers: ${min_price:.2f} - ${max_price:.2f}")
-
-                    # BIN deals
-                    deals = self.find_tiered_deals(page, query, tiers)
-                    for deal in deals:
-                        dedupe_key = deal["item_id"] or deal.get("link", "")
-                        if dedupe_key not in player_seen:
-                            player_seen.add(dedupe_key)
-                            deal["search_sold"] = numbered_search_sold
-                            numbered_deals.append(deal)
-
-                    # Auctions
-                    auctions = self.find_tiered_auction_deals(page, query, tiers)
-                    for auction in auctions:
-                        dedupe_key = auction["item_id"] or auction.get("link", "")
-                        if dedupe_key not in player_seen:
-                            player_seen.add(dedupe_key)
-                            numbered_auctions.append(auction)
-
-                    if numbered_deals or numbered_auctions:
-                        print(f"      ✅ {len(numbered_deals)} BIN, {len(numbered_auctions)} auctions")
-                    else:
-                        print(f"      ❌ No numbered deals")
-
-                    time.sleep(random.uniform(2, 4))
-
-                # Run other searches
-                searches = config.get("searches", [])
-                for search in searches:
-                    query = search["query"]
-                    max_price = search["price"]
-
-                    print(f"\n   🔍 Search: {query}")
-                    print(f"      Max: ${max_price:.2f}")
-
-                    search_sold = search.get("search_sold", True)
-
-                    # BIN deals
-                    deals = self.find_deals(page, query, max_price)
-                    for deal in deals:
-                        dedupe_key = deal["item_id"] or deal.get("link", "")
-                        if dedupe_key not in player_seen:
-                            player_seen.add(dedupe_key)
-                            deal["search_query"] = query
-                            deal["search_sold"] = search_sold
-                            other_deals.append(deal)
-
-                    # Auctions
-                    auctions = self.find_auction_deals(page, query, max_price)
-                    for auction in auctions:
-                        dedupe_key = auction["item_id"] or auction.get("link", "")
-                        if dedupe_key not in player_seen:
-                            player_seen.add(dedupe_key)
-                            auction["search_query"] = query
-                            other_auctions.append(auction)
-
-                    if deals or auctions:
-                        new_deals = len([d for d in deals if d.get("search_query")])
-                        new_auctions = len([a for a in auctions if a.get("search_query")])
-                        print(f"      ✅ {new_deals} BIN, {new_auctions} auctions (after dedupe)")
-                    else:
-                        print(f"      ❌ No deals")
-
-                    time.sleep(random.uniform(2, 4))
-
-                # Fetch sold prices for BIN deals (cached weekly)
-                all_bin_deals = numbered_deals + other_deals
-                sold_eligible = [d for d in all_bin_deals if d.get("search_sold", True)]
-                if sold_eligible:
-                    print(f"\n   💰 Fetching sold prices for {len(sold_eligible)} deals...")
-                    cached_count = 0
-                    fetched_count = 0
-                    for deal in sold_eligible:
-                        # Use tier-specific key for numbered deals, title-based for others
-                        if deal.get("tier_max") and deal.get("numbered_query"):
-                            tier = {"min": 0, "max": deal["tier_max"]}  # Only max matters for key
-                            cache_key = self._get_tier_sold_key(deal["numbered_query"], tier)
-                        else:
-                            cache_key = self._get_cache_key(deal['title'])
-                        cache = self._load_sold_cache()
-                        if cache_key in cache and self._is_cache_valid(cache[cache_key]):
-                            deal['sold_info'] = cache[cache_key]
-                            cached_count += 1
-                        else:
-                            result = self.scrape_sold_prices(page, cache_key)
-                            if result:
-                                cache[cache_key] = result
-                                self._save_sold_cache(cache)
-                                deal['sold_info'] = result
-                                fetched_count += 1
-                            time.sleep(random.uniform(1, 2))
-                    print(f"      ✅ {cached_count} cached, {fetched_count} fetched")
-
-                context.close()
-
-                # Summary for player
-                player_total = len(numbered_deals) + len(numbered_auctions) + len(other_deals) + len(other_auctions)
-                total_deals += len(numbered_deals) + len(other_deals)
-                total_auctions += len(numbered_auctions) + len(other_auctions)
-
-                if player_total > 0:
-                    print(f"\n   📧 {player}: {player_total} total deals")
-                    self.send_player_email(player, numbered_deals, numbered_auctions, other_deals, other_auctions)
-                else:
-                    print(f"\n   ❌ No deals for {player}")
+        if browser is None:
+            async with async_playwright() as p:
+                print("Starting browser...")
+                browser = await p.chromium.launch(headless=True)
+                try:
+                    results = await self._scan_players(browser, players, sold_cache)
+                finally:
+                    await self._close_workers()
+                    await browser.close()
+        else:
+            results = await self._scan_players(browser, players, sold_cache)
+
+        # Collect every player's deals into one email for the whole scan
+        player_deals = []
+        for (player, _), (numbered_deals, numbered_auctions, other_deals, other_auctions) in zip(players, results):
+            # Summary for player
+            player_total = len(numbered_deals) + len(numbered_auctions) + len(other_deals) + len(other_auctions)
+            total_deals += len(numbered_deals) + len(other_deals)
+            total_auctions += len(numbered_auctions) + len(other_auctions)
+
+            if player_total > 0:
+                print(f"\n   📧 {player}: {player_total} total deals")
+                player_deals.append((player, numbered_deals, numbered_auctions, other_deals, other_auctions))
+            else:
+                print(f"\n   ❌ No deals for {player}")
 
-            browser.close()
+        try:
+            self.send_scan_email(player_deals)
 
-        self._save_seen_listings()
+            self._save_seen_listings()
+            self._save_auction_empty()
 
-        # Send any queued emails from quiet hours
-        self._send_queued_emails()
+            # Send any queued emails from quiet hours
+            self._send_queued_emails()
+        finally:
+            self._close_smtp()
 
         print(f"\n{'='*60}")
         print(f"Scan Complete - {total_deals} BIN deal(s), {total_auctions} auction(s)")
@@ -1007,60 +1635,193 @@ class EbayCardMonitor:
 
     def _queue_email(self, subject: str, body: str):
         """Queue an email to be sent after quiet hours."""
-        queue_file = Path("email_queue.json")
-        queue = []
-        if queue_file.exists():
-            with open(queue_file, "r") as f:
-                queue = json.load(f)
-
-        queue.append({
+        email = {
             "subject": subject,
             "body": body,
             "queued_at": datetime.now().isoformat()
-        })
-
-        with open(queue_file, "w") as f:
-            json.dump(queue, f, indent=2)
+        }
+        with open(EMAIL_QUEUE_FILE, "ab") as f:
+            f.write(_json_dumps(email) + b"\n")
         print("  📬 Email queued (quiet hours)")
 
+    def _load_queue_cursor(self) -> int:
+        """Byte offset in EMAIL_QUEUE_FILE of the first email not yet handled.
+
+        Falls back to 0 (the whole queue) for a missing, unreadable or stale cursor.
+        """
+        try:
+            cursor = _json_loads(EMAIL_QUEUE_CURSOR_FILE.read_bytes())
+            offset = cursor["offset"]
+            stat = EMAIL_QUEUE_FILE.stat()
+            # A cursor for another (since replaced) queue file, or past its end, is stale
+            if cursor["inode"] != stat.st_ino or not 0 <= offset <= stat.st_size:
+                return 0
+            if offset:
+                # Only trust offsets that land on a line boundary
+                with open(EMAIL_QUEUE_FILE, "rb") as f:
+                    f.seek(offset - 1)
+                    if f.read(1) != b"\n":
+                        return 0
+            return offset
+        except Exception:
+            return 0
+
+    def _save_queue_cursor(self, offset: int):
+        cursor = {"inode": EMAIL_QUEUE_FILE.stat().st_ino, "offset": offset}
+        with open(EMAIL_QUEUE_CURSOR_FILE, "wb") as f:
+            f.write(_json_dumps(cursor))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _migrate_legacy_queue(self):
+        """Fold an older email_queue.json into the NDJSON queue, ahead of newer entries."""
+        legacy = b"".join(_json_dumps(email) + b"\n"
+                          for email in _json_loads(LEGACY_EMAIL_QUEUE_FILE.read_bytes()))
+        pending = b""
+        if EMAIL_QUEUE_FILE.exists():
+            # Drop emails already handled, so the cursor can start over at the legacy ones
+            pending = EMAIL_QUEUE_FILE.read_bytes()[self._load_queue_cursor():]
+        EMAIL_QUEUE_FILE.write_bytes(legacy + pending)
+        EMAIL_QUEUE_CURSOR_FILE.unlink(missing_ok=True)
+        LEGACY_EMAIL_QUEUE_FILE.unlink()
+
     def _send_queued_emails(self):
-        """Send any emails that were queued during quiet hours."""
+        """Send any emails that were queued during quiet hours.
+
+        Progress is saved to EMAIL_QUEUE_CURSOR_FILE after each email, so a flush that
+        dies or loses its SMTP session resumes after the last email handled instead of
+        resending the ones before it.
+        """
         if self._is_quiet_hours():
             return
 
-        queue_file = Path("email_queue.json")
-        if not queue_file.exists():
+        if LEGACY_EMAIL_QUEUE_FILE.exists():
+            self._migrate_legacy_queue()
+        if not EMAIL_QUEUE_FILE.exists():
             return
 
-        with open(queue_file, "r") as f:
-            queue = json.load(f)
+        # (offset just past the line, email) for each email after the cursor. Emails
+        # before it were handled by an earlier flush; their keys stop repeats going out again
+        cursor = self._load_queue_cursor()
+        handled = set()
+        entries = []
+        with open(EMAIL_QUEUE_FILE, "rb") as f:
+            for line in iter(f.readline, b""):
+                if not line.strip():
+                    continue
+                try:
+                    email = _json_loads(line)
+                except ValueError:
+                    email = None
+                if not isinstance(email, dict) or "subject" not in email or "body" not in email:
+                    # e.g. a line cut short by a crash mid-append; it can never be sent
+                    if f.tell() > cursor:
+                        print("  ⚠️  Skipping unreadable queued email")
+                    continue
+                if f.tell() <= cursor:
+                    handled.add((email["subject"], email["body"]))
+                else:
+                    entries.append((f.tell(), email))
+
+        def unsent(pending):
+            return len({(email["subject"], email["body"]) for _, email in pending} - handled)
+
+        if entries:
+            # Quiet-hour scans often queue the same email more than once; send each one once
+            unique = unsent(entries)
+            if unique < len(entries):
+                print(f"📬 Dropping {len(entries) - unique} duplicate queued email(s)")
+            print(f"📬 Sending {unique} queued email(s)...")
+
+        # All queued emails go over the scan's one SMTP session
+        for i, (offset, email) in enumerate(entries):
+            key = (email["subject"], email["body"])
+            if key not in handled:
+                msg = EmailMessage()
+                msg["From"] = EMAIL_CONFIG["sender_email"]
+                msg["To"] = EMAIL_CONFIG["recipient_email"]
+                msg["Subject"] = email["subject"]
+                msg.set_content(email["body"])
 
-        if not queue:
+                try:
+                    self._send_message(msg)
+                    print(f"  📧 Sent: {email['subject']}")
+                except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError,
+                        smtplib.SMTPAuthenticationError) as e:
+                    # No usable session, so the rest would fail too - keep them for the next scan
+                    print(f"  ⚠️  Failed to send queued email: {e}")
+                    break
+                except smtplib.SMTPException as e:
+                    # The server rejected this message; retrying it won't help
+                    print(f"  ⚠️  Failed to send queued email: {e}")
+                except OSError as e:
+                    print(f"  ⚠️  Failed to send queued email: {e}")
+                    break
+                handled.add(key)
+            self._save_queue_cursor(offset)
+        else:
+            # Every email was handled. Cursor first: a cursor left without its queue
+            # could otherwise be applied to the next one
+            EMAIL_QUEUE_CURSOR_FILE.unlink(missing_ok=True)
+            EMAIL_QUEUE_FILE.unlink(missing_ok=True)
+            if entries:
+                print("📬 Queue cleared")
             return
 
-        print(f"📬 Sending {len(queue)} queued email(s)...")
+        print(f"📬 {unsent(entries[i:])} email(s) left queued")
 
-        for email in queue:
-            msg = MIMEMultipart()
-            msg["From"] = EMAIL_CONFIG["sender_email"]
-            msg["To"] = EMAIL_CONFIG["recipient_email"]
-            msg["Subject"] = email["subject"]
-            msg.attach(MIMEText(email["body"], "plain"))
+    async def check_http_parser(self, query: str) -> bool:
+        """Extract one search page with both the plain-HTTP parser and _LISTINGS_JS.
 
-            try:
-                with smtplib.SMTP(EMAIL_CONFIG["smtp_server"], EMAIL_CONFIG["smtp_port"]) as server:
-                    server.starttls()
-                    server.login(EMAIL_CONFIG["sender_email"], EMAIL_CONFIG["sender_password"])
-                    server.send_message(msg)
-                print(f"  📧 Sent: {email['subject']}")
-            except Exception as e:
-                print(f"  ⚠️  Failed to send queued email: {e}")
-
-        # Clear the queue
-        queue_file.unlink()
-        print("📬 Queue cleared")
-
-    def refresh_sold_cache(self):
+        The browser is served the exact HTML the plain fetch got (its stylesheets still
+        load), so any difference comes from the extraction, not from listings changing.
+        Returns True if every card matches.
+        """
+        if not (HTTP_AVAILABLE and PLAYWRIGHT_AVAILABLE):
+            print("❌ Needs requests, beautifulsoup4 and playwright installed.")
+            return False
+
+        url = self.build_search_url(query)
+        status, html = await asyncio.to_thread(self._fetch_search_html, url)
+        http_items = _parse_listing_cards(html) if status == 200 else None
+        if http_items is None:
+            print(f"❌ Plain fetch didn't return a results page (HTTP {status})")
+            return False
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            context = await self._new_context(browser)
+            page = await context.new_page()
+
+            async def serve_fetched(route):
+                await route.fulfill(status=200, content_type="text/html", body=html)
+
+            await page.route(url, serve_fetched)
+            await page.goto(url, wait_until="load", timeout=30000)
+            browser_items = await page.eval_on_selector_all("li.s-card", _LISTINGS_JS)
+            await browser.close()
+
+        # _scrape_listings strips titles (and prices parse the same either way)
+        def normalized(item):
+            return dict(item, title=(item["title"] or "").strip(), price=(item["price"] or "").strip())
+
+        by_id = {item["id"]: normalized(item) for item in browser_items}
+        matched = 0
+        for item in map(normalized, http_items):
+            expected = by_id.pop(item["id"], None)
+            if expected == item:
+                matched += 1
+                continue
+            print(f"❌ {item['id']}")
+            print(f"   browser: {expected}")
+            print(f"   http:    {item}")
+        for item_id in by_id:
+            print(f"❌ {item_id} only found by the browser")
+
+        print(f"{matched}/{len(http_items)} cards match")
+        return matched == len(http_items) and not by_id
+
+    async def refresh_sold_cache(self):
         """Pre-populate sold prices cache for all watchlist items."""
         print("============================================================")
         print("Sold Price Cache Refresh")
@@ -1112,17 +1873,15 @@ class EbayCardMonitor:
             print("✅ All cache entries are fresh!")
             return
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-                viewport={"width": 1920, "height": 1080}
-            )
-            page = context.new_page()
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            # One context and page for every query, so cookies and connections carry over
+            context = await self._new_context(browser)
+            page = await context.new_page()
 
             for i, query in enumerate(stale_queries, 1):
                 print(f"[{i}/{len(stale_queries)}] Fetching: {query[:50]}...")
-                result = self.scrape_sold_prices(page, query)
+                result = await self.scrape_sold_prices(page, query)
                 if result:
                     cache[query] = result
                     print(f"   ✅ Avg: ${result['avg_price']:.2f} ({result['num_sold']} sold)")
@@ -1130,9 +1889,8 @@ class EbayCardMonitor:
                     print(f"   ❌ No data found")
 
                 self._save_sold_cache(cache)
-                time.sleep(random.uniform(2, 4))
 
-            browser.close()
+            await browser.close()
 
         print(f"\n✅ Cache refresh complete!")
 
@@ -1144,6 +1902,9 @@ def main():
     parser.add_argument("--clear-all", action="store_true", help="Clear all history")
     parser.add_argument("--hide", nargs=2, metavar=("PLAYER", "ITEM_ID"), help="Hide a specific item for a player")
     parser.add_argument("--refresh-sold", action="store_true", help="Refresh sold prices cache (run weekly)")
+    parser.add_argument("--check-http", metavar="QUERY", help="Check the plain-HTTP parser against the browser on one search")
+    parser.add_argument("--daemon", action="store_true", help="Keep running, scanning every --interval seconds with a warm browser")
+    parser.add_argument("--interval", type=int, default=3600, metavar="SECS", help="Seconds between daemon scans (default: 3600)")
     args = parser.parse_args()
 
     monitor = EbayCardMonitor()
@@ -1151,8 +1912,7 @@ def main():
     # Handle clear/hide commands
     if args.hide:
         player, item_id = args.hide
-        monitor.current_player = player
-        monitor._mark_seen(item_id)
+        monitor._mark_seen(player, item_id)
         monitor._save_seen_listings()
         print(f"Hidden item {item_id} for {player}.")
         return
@@ -1160,12 +1920,15 @@ def main():
         monitor.clear_player_history(args.clear)
         return
     if args.clear_all:
-        monitor.seen_listings = {}
-        monitor._save_seen_listings()
+        monitor.clear_all_history()
         print("Cleared all history.")
         return
     if args.refresh_sold:
-        monitor.refresh_sold_cache()
+        asyncio.run(monitor.refresh_sold_cache())
+        return
+    if args.check_http:
+        if not asyncio.run(monitor.check_http_parser(args.check_http)):
+            sys.exit(1)
         return
 
     if not PLAYWRIGHT_AVAILABLE:
@@ -1185,7 +1948,10 @@ def main():
         sys.exit(0)
 
     try:
-        monitor.run_scan()
+        if args.daemon:
+            asyncio.run(monitor.run_daemon(args.interval))
+        else:
+            asyncio.run(monitor.run_scan())
     finally:
         fcntl.flock(lock_fd, fcntl.LOCK_UN)
         lock_fd.close()